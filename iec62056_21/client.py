@@ -5,6 +5,10 @@ from iec62056_21 import messages, constants, transports, exceptions
 
 logger = logging.getLogger(__name__)
 
+# The identification message starts with / and ends with CR LF.
+_IDENTIFICATION_START_CHAR = b"/"
+_IDENTIFICATION_END_CHAR = b"\x0a"
+
 
 class Iec6205621Client:
     """
@@ -256,7 +260,9 @@ class Iec6205621Client:
         Properly receive the identification message and parse it.
         """
 
-        data = self.transport.simple_read(start_char="/", end_char="\x0a")
+        data = self.transport.simple_read(
+            start_char=_IDENTIFICATION_START_CHAR, end_char=_IDENTIFICATION_END_CHAR
+        )
 
         identification = messages.IdentificationMessage.from_bytes(data)
         logger.info(f"Received identification message: {identification}")
@@ -281,13 +287,13 @@ class Iec6205621Client:
 
         timeout = 2.2
         duration = 0
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Sending battery startup sequence")
         while duration < timeout:
             out = b"\x00"
             self.transport.send(out)
             self.rest(0.2)
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
         logger.info("Startup Sequence finished")
 
         self.rest(1.5)
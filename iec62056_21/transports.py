@@ -1,6 +1,10 @@
+import re
 import time
+import functools
+import asyncio
 import logging
-from typing import Tuple, Union, Optional
+import selectors
+from typing import Tuple, Optional
 
 import serial
 import socket
@@ -8,6 +12,167 @@ from iec62056_21 import utils, exceptions, constants
 
 logger = logging.getLogger(__name__)
 
+# Control chars as ints, for comparing against single items of a frame.
+_SOH = 0x01
+_ETX = 0x03
+_EOT = 0x04
+
+# Replies and separators sent or added as is, encoded once.
+_ACK = constants.ACK.encode(constants.ENCODING)
+_NACK = constants.NACK.encode(constants.ENCODING)
+_LINE_END = constants.LINE_END.encode(constants.ENCODING)
+
+
+def _frame_bcc_valid(frame: bytes) -> bool:
+    """
+    Checks the BCC of a received frame in a single pass over the frame. The BCC
+    covers everything after the start char up to and including the end char.
+    """
+    return utils.calculate_bcc(memoryview(frame)[1:-1])[0] == frame[-1]
+
+
+class _FrameFinder:
+    """
+    Finds frames in a receive buffer. A frame starts with one of `start_chars` and
+    ends with one of `end_chars` followed by `trailing` bytes.
+    """
+
+    def __init__(self, start_chars: bytes, end_chars: bytes, trailing: int):
+        self._start = re.compile(b"[" + re.escape(start_chars) + b"]")
+        self._end = re.compile(b"[" + re.escape(end_chars) + b"]")
+        self._trailing = trailing
+
+    def find(self, buf: bytearray, scanned: int) -> Tuple[Optional[bytes], int]:
+        """
+        Removes and returns the first complete frame in buf. Data before the start
+        char is removed from buf. `scanned` is the offset up to which buf has
+        already been searched for an end char, so data is only scanned once while a
+        frame arrives in pieces.
+        Returns the frame, or None if it is not complete, and the new scanned offset.
+
+        :param buf:
+        :param scanned:
+        """
+        start = self._start.search(buf)
+        if start is None:
+            # Nothing of interest in the buffer.
+            buf.clear()
+            return None, 0
+        if start.start():
+            del buf[: start.start()]
+            scanned = 0
+
+        end = self._end.search(buf, max(scanned, 1))
+        if end is None:
+            return None, len(buf)
+
+        frame_end = end.end() + self._trailing
+        if len(buf) < frame_end:
+            # Waiting for the trailing bytes.
+            return None, end.start()
+
+        frame = bytes(buf[:frame_end])
+        del buf[:frame_end]
+        return frame, 0
+
+
+@functools.lru_cache(maxsize=None)
+def _simple_frame_finder(start_char: bytes, end_char: bytes) -> _FrameFinder:
+    return _FrameFinder(start_char, end_char, trailing=0)
+
+
+# A readout frame starts with SOH or STX and ends with ETX or EOT followed by the BCC.
+_READOUT_FRAME = _FrameFinder(b"\x01\x02", b"\x03\x04", trailing=1)
+
+
+class _ReadoutAssembler:
+    """
+    Assembles a readout from received frames without doing any I/O, so all
+    transports share the same block handling.
+
+    Each received frame is passed to `add`, which returns the reply to send to the
+    device, if any. `data` is set once the readout is complete. When using partial
+    blocks the readout is recreated as if it was not sent with partial blocks.
+    """
+
+    def __init__(self):
+        self.data: Optional[bytes] = None
+        self.add = self._add_first
+        self._blocks = bytearray()
+        # The leading STX is only kept for the first block.
+        self._data_start = 0
+
+    def _add_first(self, frame: bytes) -> Optional[bytes]:
+        """
+        The first frame decides how the rest of the readout is handled.
+        """
+        if frame[0] == _SOH:
+            # This is a command message, probably Password challange.
+            self.data = frame
+            return None
+        if frame[-2] == _ETX:
+            self.add = self._add_single_frame
+        else:
+            self.add = self._add_partial_block
+        return self.add(frame)
+
+    def _add_single_frame(self, frame: bytes) -> Optional[bytes]:
+        """
+        A readout sent in a single frame. Invalid frames are NACKed and read again.
+        """
+        if not _frame_bcc_valid(frame):
+            return _NACK
+        self.data = frame
+        return None
+
+    def _add_partial_block(self, frame: bytes) -> Optional[bytes]:
+        """
+        A readout sent in partial blocks. Each valid block ending with EOT is ACKed,
+        invalid blocks are NACKed and read again.
+        """
+        if not _frame_bcc_valid(frame):
+            return _NACK
+
+        if frame[-2] == _EOT:
+            # remove the bcc and eot and add line end.
+            self._blocks.extend(memoryview(frame)[self._data_start : -2])
+            self._blocks.extend(_LINE_END)
+            self._data_start = 1
+            return _ACK
+
+        # The last block. Its bcc is not correct compared to the whole message. But
+        # we have verified all the bccs along the way so we just compute it so the
+        # message is usable.
+        self._blocks.extend(memoryview(frame)[self._data_start : -1])
+        self.data = utils.add_bcc(bytes(self._blocks))
+        return None
+
+
+_RECV_CHUNK_SIZE = 16384
+_SOCKET_BUFFER_SIZE = 65536
+_KEEPALIVE_IDLE = 30
+_KEEPALIVE_INTERVAL = 10
+_USER_TIMEOUT_MS = 60_000
+
+
+def _tune_tcp_socket(s: socket.socket) -> None:
+    """
+    Sets the socket options used for TCP connections to devices.
+    """
+    # The protocol is small request/response messages. Don't let Nagle's
+    # algorithm hold back ACK/NACKs.
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+    # Keep the connection alive between polls and detect dead connections.
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPALIVE_IDLE)
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, _KEEPALIVE_INTERVAL)
+    if hasattr(socket, "TCP_USER_TIMEOUT"):  # Linux only
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, _USER_TIMEOUT_MS)
+
 
 class TransportError(Exception):
     """General transport error"""
@@ -19,9 +184,14 @@ class BaseTransport:
     """
 
     TRANSPORT_REQUIRES_ADDRESS: bool = True
+    RECV_CHUNK_SIZE: int = _RECV_CHUNK_SIZE
 
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
+        # Received data not yet consumed by a read. Kept between reads.
+        self._rxbuf = bytearray()
+        # Chunk for transports that can receive into a buffer. See _recv_chunk.
+        self._rxchunk: Optional[memoryview] = None
 
     def connect(self) -> None:
         raise NotImplemented("Must be defined in subclass")
@@ -38,139 +208,57 @@ class BaseTransport:
         :param timeout:
         :return:
         """
-        start_chars = [b"\x01", b"\x02"]
-        end_chars = [b"\x03", b"\x04"]
-        total_data = b""
-        packets = 0
-        start_char_received = False
-        start_char = None
-        end_char = None
         timeout = timeout or self.timeout
-
-        while True:
-
-            in_data = b""
-            duration: float = 0.0
-            start_time = time.time()
-            while True:
-                b = self.recv(1)
-
-                duration = time.time() - start_time
-                if duration > self.timeout:
-                    raise TimeoutError(f"Read in {self.__class__.__name__} timed out")
-                if not start_char_received:
-                    # is start char?
-                    if b in start_chars:
-                        in_data += b
-                        start_char_received = True
-                        start_char = b
-                        continue
-                    else:
-                        continue
-                else:
-                    # is end char?
-                    if b in end_chars:
-                        in_data += b
-                        end_char = b
-                        break
-                    else:
-                        in_data += b
-                        continue
-
-            packets += 1
-
-            bcc = self.recv(1)
-            in_data += bcc
-            logger.debug(
-                f"Received {in_data!r} over transport: {self.__class__.__name__}"
-            )
-
-            if start_char == b"\x01":
-                # This is a command message, probably Password challange.
-                total_data += in_data
-                break
-
-            if end_char == b"\x04":  # EOT (partial read)
-                # we received a partial block
-                if not utils.bcc_valid(in_data):
-                    # Nack and read again
-                    self.send(constants.NACK.encode(constants.ENCODING))
-                    continue
-                else:
-                    # ack and read next
-                    self.send(constants.ACK.encode(constants.ENCODING))
-                    # remove bcc and eot and add line end.
-                    in_data = in_data[:-2] + constants.LINE_END.encode(
-                        constants.ENCODING
-                    )
-                    if packets > 1:
-                        # remove the leading STX
-                        in_data = in_data[1:]
-
-                    total_data += in_data
-                    continue
-
-            if end_char == b"\x03":
-                # Either it was the only message or we got the last message.
-                if not utils.bcc_valid(in_data):
-                    # Nack and read again
-                    self.send(constants.NACK.encode(constants.ENCODING))
-                    continue
-                else:
-                    if packets > 1:
-                        in_data = in_data[1:]  # removing the leading STX
-                    total_data += in_data
-                    if packets > 1:
-                        # The last bcc is not correct compared to the whole
-                        # message. But we have verified all the bccs along the way so
-                        # we just compute it so the message is usable.
-                        total_data = utils.add_bcc(total_data[:-1])
-
-                    break
-
-        return total_data
+        readout = _ReadoutAssembler()
+        while readout.data is None:
+            reply = readout.add(self._read_frame(_READOUT_FRAME, timeout=timeout))
+            if reply:
+                self.send(reply)
+        return readout.data
 
     def simple_read(
-        self,
-        start_char: Union[str, bytes],
-        end_char: Union[str, bytes],
-        timeout: Optional[int] = None,
+        self, start_char: bytes, end_char: bytes, timeout: Optional[int] = None
     ) -> bytes:
         """
         A more flexible read for use with some messages.
         """
-        _start_char = utils.ensure_bytes(start_char)
-        _end_char = utils.ensure_bytes(end_char)
-
-        in_data = b""
-        start_char_received = False
         timeout = timeout or self.timeout
-        duration: float = 0.0
-        start_time = time.time()
+        return self._read_frame(
+            _simple_frame_finder(start_char, end_char), timeout=timeout
+        )
+
+    def _read_frame(self, finder: _FrameFinder, timeout: float) -> bytes:
+        """
+        Reads from the receive buffer until a frame found by the finder is
+        available. The frame and any data before it is removed from the buffer.
+        The buffer is only refilled from the transport when it has been scanned
+        without finding a complete frame.
+
+        :param finder:
+        :param timeout:
+        """
+        buf = self._rxbuf
+        cls_name = type(self).__name__
+        find = finder.find
+        fill = self._fill
+        monotonic = time.monotonic
+        deadline = monotonic() + timeout
+        scanned = 0
         while True:
-            b = self.recv(1)
-            duration = time.time() - start_time
-            if duration > self.timeout:
-                raise TimeoutError(f"Read in {self.__class__.__name__} timed out")
-            if not start_char_received:
-                # is start char?
-                if b == _start_char:
-                    in_data += b
-                    start_char_received = True
-                    continue
-                else:
-                    continue
-            else:
-                # is end char?
-                if b == _end_char:
-                    in_data += b
-                    break
-                else:
-                    in_data += b
-                    continue
-
-        logger.debug(f"Received {in_data!r} over transport: {self.__class__.__name__}")
-        return in_data
+            frame, scanned = find(buf, scanned)
+            if frame is not None:
+                logger.debug("Received %r over transport: %s", frame, cls_name)
+                return frame
+
+            remaining = deadline - monotonic()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError(f"Read in {cls_name} timed out")
+                fill(remaining)
+            except TimeoutError:
+                # Don't let a partial frame end up in the next read.
+                buf.clear()
+                raise
 
     def send(self, data: bytes) -> None:
         """
@@ -179,7 +267,7 @@ class BaseTransport:
         :param data:
         """
         self._send(data)
-        logger.debug(f"Sent {data!r} over transport: {self.__class__.__name__}")
+        logger.debug("Sent %r over transport: %s", data, self.__class__.__name__)
 
     def _send(self, data: bytes) -> None:
         """
@@ -191,10 +279,15 @@ class BaseTransport:
 
     def recv(self, chars: int) -> bytes:
         """
-        Will receive data over the transport.
+        Will receive data over the transport. Data already in the receive buffer is
+        returned first.
 
         :param chars:
         """
+        if self._rxbuf:
+            data = bytes(self._rxbuf[:chars])
+            del self._rxbuf[:chars]
+            return data
         return self._recv(chars)
 
     def _recv(self, chars: int) -> bytes:
@@ -205,6 +298,27 @@ class BaseTransport:
         """
         raise NotImplemented("Must be defined in subclass")
 
+    def _recv_chunk(self) -> memoryview:
+        """
+        Returns a preallocated chunk for transports that can receive into a buffer,
+        so they don't allocate on each read. It is allocated on first use and then
+        reused, so transports that never receive into a buffer don't carry it.
+        """
+        if self._rxchunk is None:
+            self._rxchunk = memoryview(bytearray(self.RECV_CHUNK_SIZE))
+        return self._rxchunk
+
+    def _fill(self, timeout: float) -> None:
+        """
+        Transport dependant filling of the receive buffer. Should add all data that is
+        readily available on the transport, blocking at most `timeout` seconds until
+        some data arrives.
+        Falls back to reading a single byte for transports that only define `_recv`.
+
+        :param timeout:
+        """
+        self._rxbuf += self._recv(1)
+
     def switch_baudrate(self, baud: int) -> None:
         """
         The protocol defines a baudrate switchover process. Though it might not be used
@@ -256,6 +370,7 @@ class SerialTransport(BaseTransport):
 
         self.port.close()
         self.port = None
+        self._rxbuf.clear()
 
     def _send(self, data: bytes) -> None:
         """
@@ -267,7 +382,6 @@ class SerialTransport(BaseTransport):
             raise TransportError("Serial port is closed.")
 
         self.port.write(data)
-        self.port.flush()
 
     def _recv(self, chars: int = 1) -> bytes:
         """
@@ -280,6 +394,28 @@ class SerialTransport(BaseTransport):
 
         return self.port.read(chars)
 
+    def _fill(self, timeout: float) -> None:
+        """
+        Reads all bytes waiting in the serial port. If none are waiting it blocks for
+        the first byte and then drains what arrived with it. The wait is bounded by
+        the timeout of the port since changing it per read would reconfigure the port.
+
+        :param timeout:
+        """
+        if self.port is None:
+            raise TransportError("Serial port is closed.")
+
+        waiting = self.port.in_waiting
+        if not waiting:
+            first = self.port.read(1)
+            if not first:
+                return
+            self._rxbuf += first
+            waiting = self.port.in_waiting
+
+        if waiting:
+            self._rxbuf += self.port.read(waiting)
+
     def switch_baudrate(self, baud: int) -> None:
         """
         Creates a new serial port with the correct baudrate.
@@ -289,6 +425,8 @@ class SerialTransport(BaseTransport):
         if self.port is None:
             raise TransportError("Serial port is closed.")
 
+        # Make sure everything sent at the current baudrate has left the port.
+        self.port.flush()
         logger.info(f"Switching baudrate to: {baud}")
         self.port = self.port = serial.Serial(
             self.port_name,
@@ -315,33 +453,99 @@ class TcpTransport(BaseTransport):
 
     """
     Transport class for TCP/IP communication.
+
+    With `busy_wait` the transport polls the socket instead of sleeping in the
+    kernel while waiting for data. This lowers the latency of each short exchange
+    at the cost of keeping one CPU core fully busy during reads.
+
+    The connection is kept alive with TCP keepalive, so when polling a device
+    regularly there is no need to disconnect between polls. Calling connect on an
+    already connected transport reuses the connection, or makes a new one if the
+    device has closed it.
     """
 
-    def __init__(self, address: Tuple[str, int], timeout: int = 30):
+    def __init__(
+        self, address: Tuple[str, int], timeout: int = 30, busy_wait: bool = False
+    ):
 
         super().__init__(timeout=timeout)
         self.address = address
+        self.busy_wait = busy_wait
         self.socket: Optional[socket.socket] = self._get_socket()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._connected = False
+        # Set when the socket was closed because the connection failed.
+        self._connection_lost = False
 
     def connect(self) -> None:
         """
-        Connects the socket to the device network interface.
+        Connects the socket to the device network interface. If the socket is
+        already connected the connection is reused for a new session, and any data
+        left over from the previous session is discarded. If the device has closed
+        the connection a new one is made.
         """
+        if self._connected:
+            if self._discard_pending():
+                self._rxbuf.clear()
+                return
+            logger.debug("Connection to %s was closed, reconnecting", self.address)
+            self._close_socket()
 
         if not self.socket:
             self.socket = self._get_socket()
-        logger.debug(f"Connecting to {self.address}")
+        logger.debug("Connecting to %s", self.address)
         self.socket.connect(self.address)
+        self._connected = True
+        self._connection_lost = False
 
     def disconnect(self) -> None:
         """
-        Closes and removes the socket.
+        Closes and removes the socket. Does nothing if the socket was already closed
+        because the connection failed.
         """
         if self.socket is None:
+            if self._connection_lost:
+                self._connection_lost = False
+                return
             raise TransportError("Socket is closed")
 
-        self.socket.close()
-        self.socket = None
+        self._close_socket()
+
+    def _discard_pending(self) -> bool:
+        """
+        Discards data waiting on a connected socket. Returns False if the device has
+        closed the connection.
+        """
+        selector = self._get_selector()
+        chunk = self._recv_chunk()
+        while selector.select(0):
+            try:
+                if not self.socket.recv_into(chunk):
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _lose_connection(self) -> None:
+        """
+        Closes the socket after the connection failed, so the next connect makes a
+        new connection.
+        """
+        self._close_socket()
+        self._connection_lost = True
+
+    def _close_socket(self) -> None:
+        """
+        Closes and removes the socket so the next connect makes a new connection.
+        """
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        self._connected = False
+        self._rxbuf.clear()
 
     def _send(self, data: bytes) -> None:
         """
@@ -352,7 +556,11 @@ class TcpTransport(BaseTransport):
         if self.socket is None:
             raise TransportError("Socket is closed")
 
-        self.socket.sendall(data)
+        try:
+            self.socket.sendall(data)
+        except OSError as e:
+            self._lose_connection()
+            raise TransportError from e
 
     def _recv(self, chars: int = 1) -> bytes:
         """
@@ -363,12 +571,73 @@ class TcpTransport(BaseTransport):
         if self.socket is None:
             raise TransportError("Socket is closed")
 
+        # Wait here instead of in recv, so a timeout raises TimeoutError and keeps
+        # the connection open in both waiting modes.
+        self._wait_readable(self.timeout)
+
         try:
             b = self.socket.recv(chars)
-        except (OSError, IOError, socket.timeout, socket.error) as e:
+        except OSError as e:
+            self._lose_connection()
             raise TransportError from e
+        if not b:
+            self._lose_connection()
+            raise TransportError("Socket closed by device")
         return b
 
+    def _fill(self, timeout: float) -> None:
+        """
+        Waits for the socket to become readable and receives what is available into
+        the receive buffer.
+
+        :param timeout:
+        """
+        if self.socket is None:
+            raise TransportError("Socket is closed")
+
+        self._wait_readable(timeout)
+
+        chunk = self._recv_chunk()
+        try:
+            received = self.socket.recv_into(chunk)
+        except OSError as e:
+            self._lose_connection()
+            raise TransportError from e
+        if not received:
+            self._lose_connection()
+            raise TransportError("Socket closed by device")
+        self._rxbuf += chunk[:received]
+
+    def _get_selector(self) -> selectors.BaseSelector:
+        """
+        Returns the selector the socket is registered in, creating it on first use.
+        """
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ)
+        return self._selector
+
+    def _wait_readable(self, timeout: float) -> None:
+        """
+        Waits until the socket has data to read. Raises TimeoutError if no data
+        arrived within timeout.
+
+        :param timeout:
+        """
+        selector = self._get_selector()
+
+        if not self.busy_wait:
+            if not selector.select(timeout):
+                raise TimeoutError(f"Read in {self.__class__.__name__} timed out")
+            return
+
+        deadline = time.monotonic() + timeout
+        while not selector.select(0):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Read in {self.__class__.__name__} timed out")
+            # Let other threads run between polls.
+            time.sleep(0)
+
     def switch_baudrate(self, baud: int) -> None:
         """
         Baudrate has not meaning in TCP/IP so we just dont do anything.
@@ -383,11 +652,178 @@ class TcpTransport(BaseTransport):
         """
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.settimeout(self.timeout)
+        _tune_tcp_socket(s)
         return s
 
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
             f"address={self.address!r}, "
-            f"timeout={self.timeout!r}"
+            f"timeout={self.timeout!r}, "
+            f"busy_wait={self.busy_wait!r})"
+        )
+
+
+class AsyncTcpTransport:
+    """
+    Transport class for TCP/IP communication using asyncio.
+
+    Has the same interface as TcpTransport but all I/O methods are coroutines, so
+    a single thread can read many meters concurrently.
+
+    Iec6205621Client only makes synchronous calls and can not drive this transport.
+    Use its coroutines directly, for example `await transport.read()`.
+    """
+
+    TRANSPORT_REQUIRES_ADDRESS: bool = True
+
+    def __init__(self, address: Tuple[str, int], timeout: int = 30):
+        self.address = address
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self._rxbuf = bytearray()
+
+    async def connect(self) -> None:
+        """
+        Connects to the device network interface.
+        """
+        logger.debug("Connecting to %s", self.address)
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(*self.address), self.timeout
+        )
+        sock = self.writer.get_extra_info("socket")
+        if sock is not None:
+            _tune_tcp_socket(sock)
+
+    async def disconnect(self) -> None:
+        """
+        Closes the connection.
+        """
+        if self.writer is None:
+            raise TransportError("Connection is closed")
+
+        self.writer.close()
+        self.reader = None
+        self.writer = None
+        self._rxbuf.clear()
+
+    async def read(self, timeout: Optional[int] = None) -> bytes:
+        """
+        Will read a normal readout. Supports both full and partial block readout.
+        When using partial blocks it will recreate the messages as it was not sent with
+        partial blocks
+
+        :param timeout:
+        """
+        timeout = timeout or self.timeout
+        readout = _ReadoutAssembler()
+        while readout.data is None:
+            frame = await self._read_frame(_READOUT_FRAME, timeout=timeout)
+            reply = readout.add(frame)
+            if reply:
+                await self.send(reply)
+        return readout.data
+
+    async def simple_read(
+        self, start_char: bytes, end_char: bytes, timeout: Optional[int] = None
+    ) -> bytes:
+        """
+        A more flexible read for use with some messages.
+        """
+        timeout = timeout or self.timeout
+        return await self._read_frame(
+            _simple_frame_finder(start_char, end_char), timeout=timeout
+        )
+
+    async def _read_frame(self, finder: _FrameFinder, timeout: float) -> bytes:
+        """
+        Reads from the receive buffer until a frame found by the finder is
+        available. See BaseTransport._read_frame
+
+        :param finder:
+        :param timeout:
+        """
+        buf = self._rxbuf
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        scanned = 0
+        while True:
+            frame, scanned = finder.find(buf, scanned)
+            if frame is not None:
+                logger.debug(
+                    "Received %r over transport: %s", frame, self.__class__.__name__
+                )
+                return frame
+
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError(f"Read in {self.__class__.__name__} timed out")
+                await self._fill(remaining)
+            except TimeoutError:
+                # Don't let a partial frame end up in the next read.
+                buf.clear()
+                raise
+
+    async def _fill(self, timeout: float) -> None:
+        """
+        Receives what is available on the connection into the receive buffer.
+
+        :param timeout:
+        """
+        if self.reader is None:
+            raise TransportError("Connection is closed")
+
+        try:
+            data = await asyncio.wait_for(
+                self.reader.read(_RECV_CHUNK_SIZE), timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Read in {self.__class__.__name__} timed out")
+        except OSError as e:
+            raise TransportError from e
+        if not data:
+            raise TransportError("Connection closed by device")
+        self._rxbuf += data
+
+    async def send(self, data: bytes) -> None:
+        """
+        Will send data over the transport
+
+        :param data:
+        """
+        if self.writer is None:
+            raise TransportError("Connection is closed")
+
+        self.writer.write(data)
+        await self.writer.drain()
+        logger.debug("Sent %r over transport: %s", data, self.__class__.__name__)
+
+    async def recv(self, chars: int) -> bytes:
+        """
+        Will receive data over the transport. Data already in the receive buffer is
+        returned first.
+
+        :param chars:
+        """
+        if not self._rxbuf:
+            await self._fill(self.timeout)
+        data = bytes(self._rxbuf[:chars])
+        del self._rxbuf[:chars]
+        return data
+
+    async def switch_baudrate(self, baud: int) -> None:
+        """
+        Baudrate has not meaning in TCP/IP so we just dont do anything.
+
+        :param baud:
+        """
+        pass
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"address={self.address!r}, "
+            f"timeout={self.timeout!r})"
         )
@@ -53,11 +53,17 @@ def calculate_bcc(data):
 
 
 def _calculate_bcc(bytes_data: bytes):
-    bcc = 0
-    for b in bytes_data:
-        x = b & 0x7F
-        bcc ^= x
-        bcc &= 0x7F
+    # The BCC is the XOR of all bytes. Instead of looping over each byte the data is
+    # read as one integer and its upper half is XORed onto its lower half until a
+    # single byte remains.
+    length = len(bytes_data)
+    value = int.from_bytes(bytes_data, byteorder="little")
+    while length > 1:
+        half = (length + 1) // 2
+        shift = half * 8
+        value = (value & ((1 << shift) - 1)) ^ (value >> shift)
+        length = half
+    bcc = value & 0x7F
     return bcc.to_bytes(length=1, byteorder="big")
 
 
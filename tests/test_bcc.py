@@ -22,6 +22,14 @@ class TestBcc:
         bcc = calculate_bcc(data[1:-1])
         assert bcc == correct_bcc
 
+    @pytest.mark.parametrize("length", [0, 1, 2, 3, 7, 64, 1023, 4096])
+    def test_bcc_is_xor_of_all_bytes(self, length):
+        data = bytes((i * 37 + 11) % 256 for i in range(length))
+        correct_bcc = 0
+        for b in data:
+            correct_bcc ^= b & 0x7F
+        assert calculate_bcc(data) == bytes([correct_bcc])
+
     def test_add_bcc1(self):
         data = "\x01P0\x02(1234567)\x03"
         correct_data = "\x01P0\x02(1234567)\x03P"
@@ -0,0 +1,377 @@
+import asyncio
+import socket
+
+import pytest
+
+from iec62056_21 import transports, utils
+
+
+class FakeSerialPort:
+    """
+    Stands in for a serial.Serial where all data arrives at once after the first
+    byte.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = bytearray(data)
+        self.reads = []
+
+    @property
+    def in_waiting(self):
+        # Nothing is buffered until the first byte has been waited for.
+        return len(self.data) if self.reads else 0
+
+    def read(self, size=1):
+        self.reads.append(size)
+        chunk = bytes(self.data[:size])
+        del self.data[:size]
+        return chunk
+
+
+class OneByteTransport(transports.BaseTransport):
+    """
+    Transport that only defines _recv and receives a single byte per call.
+    """
+
+    def __init__(self, data: bytes, timeout: int = 5):
+        super().__init__(timeout=timeout)
+        self.data = bytearray(data)
+        self.sent = bytearray()
+
+    def _send(self, data: bytes) -> None:
+        self.sent.extend(data)
+
+    def _recv(self, chars: int = 1) -> bytes:
+        chunk = bytes(self.data[:chars])
+        del self.data[:chars]
+        return chunk
+
+
+@pytest.fixture
+def tcp_transport():
+    transport = transports.TcpTransport(address=("127.0.0.1", 5000), timeout=1)
+    transport.socket.close()
+    transport.socket, device = socket.socketpair()
+    transport.socket.settimeout(transport.timeout)
+    yield transport, device
+    if transport.socket is not None:
+        transport.socket.close()
+    device.close()
+
+
+@pytest.fixture
+def tcp_server():
+    """
+    A TcpTransport addressed to a local listening socket standing in for the device.
+    """
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(2)
+    # Fail instead of hanging if the transport never connects.
+    server.settimeout(1)
+    transport = transports.TcpTransport(address=server.getsockname(), timeout=1)
+    yield transport, server
+    if transport.socket is not None:
+        transport.disconnect()
+    server.close()
+
+
+class TestTcpTransportSocket:
+    def test_socket_has_nagle_disabled(self):
+        transport = transports.TcpTransport(address=("127.0.0.1", 5000))
+        assert transport.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        transport.socket.close()
+
+    def test_socket_has_keepalive(self):
+        transport = transports.TcpTransport(address=("127.0.0.1", 5000))
+        assert transport.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        transport.socket.close()
+
+    def test_connect_reconnects_after_device_closed_connection(self, tcp_server):
+        transport, server = tcp_server
+        transport.connect()
+        device, _ = server.accept()
+        device.close()
+        with pytest.raises(transports.TransportError):
+            transport.read()
+
+        transport.connect()
+        device, _ = server.accept()
+        frame = utils.add_bcc(b"\x02(1)\x03")
+        device.sendall(frame)
+        assert transport.read() == frame
+        device.close()
+
+    def test_connect_reconnects_after_device_closed_idle_connection(self, tcp_server):
+        transport, server = tcp_server
+        transport.connect()
+        device, _ = server.accept()
+        device.close()
+
+        transport.connect()
+        device, _ = server.accept()
+        frame = utils.add_bcc(b"\x02(1)\x03")
+        device.sendall(frame)
+        assert transport.read() == frame
+        device.close()
+
+    def test_disconnect_after_failed_read(self, tcp_server):
+        transport, server = tcp_server
+        transport.connect()
+        device, _ = server.accept()
+        device.close()
+        with pytest.raises(transports.TransportError):
+            transport.read()
+        transport.disconnect()
+        assert transport.socket is None
+
+    def test_timed_out_read_does_not_leak_into_next_read(self, tcp_server):
+        transport, server = tcp_server
+        transport.connect()
+        device, _ = server.accept()
+        device.sendall(b"\x02(1.8.0*m3/h)")
+        with pytest.raises(TimeoutError):
+            transport.read(timeout=0.2)
+
+        transport.connect()
+        device.sendall(b"/LGZ4ZMF100AC.M23\r\n")
+        assert transport.simple_read(start_char=b"/", end_char=b"\n") == (
+            b"/LGZ4ZMF100AC.M23\r\n"
+        )
+        device.close()
+
+    def test_reused_connection_starts_with_empty_buffer(self, tcp_server):
+        transport, server = tcp_server
+        transport.connect()
+        device, _ = server.accept()
+        # Left over from the previous session.
+        transport._rxbuf.extend(b"/h)")
+
+        transport.connect()
+        device.sendall(b"/LGZ4ZMF100AC.M23\r\n")
+        assert transport.simple_read(start_char=b"/", end_char=b"\n") == (
+            b"/LGZ4ZMF100AC.M23\r\n"
+        )
+        device.close()
+
+    def test_connect_reuses_connection(self, tcp_server):
+        transport, server = tcp_server
+        transport.connect()
+        connected_socket = transport.socket
+        transport.connect()
+        assert transport.socket is connected_socket
+
+
+class TestTcpTransportRead:
+    def test_read_single_frame(self, tcp_transport):
+        transport, device = tcp_transport
+        frame = utils.add_bcc(b"\x02(1234567)\r\n!\r\n\x03")
+        device.sendall(b"\x00garbage" + frame)
+        assert transport.read() == frame
+
+    def test_read_command_message(self, tcp_transport):
+        transport, device = tcp_transport
+        frame = b"\x01P0\x02(1234567)\x03P"
+        device.sendall(frame)
+        assert transport.read() == frame
+
+    def test_read_partial_blocks(self, tcp_transport):
+        transport, device = tcp_transport
+        first = utils.add_bcc(b"\x021.8.0(100*kWh)\x04")
+        last = utils.add_bcc(b"\x022.8.0(200*kWh)\r\n!\r\n\x03")
+        device.sendall(first + last)
+        data = transport.read()
+        assert data == utils.add_bcc(
+            b"\x021.8.0(100*kWh)\r\n2.8.0(200*kWh)\r\n!\r\n\x03"
+        )
+        assert device.recv(1) == b"\x06"
+
+    def test_read_partial_blocks_nacks_invalid_block(self, tcp_transport):
+        transport, device = tcp_transport
+        first = utils.add_bcc(b"\x021.8.0(100*kWh)\x04")
+        last = utils.add_bcc(b"\x022.8.0(200*kWh)\r\n!\r\n\x03")
+        device.sendall(first + last[:-1] + b"\x00" + last)
+        data = transport.read()
+        assert data == utils.add_bcc(
+            b"\x021.8.0(100*kWh)\r\n2.8.0(200*kWh)\r\n!\r\n\x03"
+        )
+        assert device.recv(2) == b"\x06\x15"
+
+    def test_read_nacks_invalid_bcc(self, tcp_transport):
+        transport, device = tcp_transport
+        frame = utils.add_bcc(b"\x02(1234567)\r\n!\r\n\x03")
+        device.sendall(frame[:-1] + b"\x00")
+        device.sendall(frame)
+        assert transport.read() == frame
+        assert device.recv(1) == b"\x15"
+
+    def test_read_reuses_receive_chunk(self, tcp_transport):
+        transport, device = tcp_transport
+        frame = utils.add_bcc(b"\x02(1)\x03")
+        device.sendall(frame)
+        assert transport.read() == frame
+        chunk = transport._rxchunk
+        device.sendall(frame)
+        assert transport.read() == frame
+        assert transport._rxchunk is chunk
+
+    def test_read_keeps_data_following_frame(self, tcp_transport):
+        transport, device = tcp_transport
+        frame = utils.add_bcc(b"\x02(1)\x03")
+        device.sendall(frame + b"\x06")
+        assert transport.read() == frame
+        assert transport.recv(1) == b"\x06"
+
+    def test_simple_read(self, tcp_transport):
+        transport, device = tcp_transport
+        device.sendall(b"\r\n/LGZ4ZMF100AC.M23\r\n")
+        assert transport.simple_read(start_char=b"/", end_char=b"\x0a") == (
+            b"/LGZ4ZMF100AC.M23\r\n"
+        )
+
+    def test_read_with_busy_wait(self, tcp_transport):
+        transport, device = tcp_transport
+        transport.busy_wait = True
+        frame = utils.add_bcc(b"\x02(1234567)\r\n!\r\n\x03")
+        device.sendall(frame + b"\x06")
+        assert transport.read() == frame
+        assert transport.recv(1) == b"\x06"
+
+    def test_busy_wait_times_out(self, tcp_transport):
+        transport, device = tcp_transport
+        transport.busy_wait = True
+        with pytest.raises(TimeoutError):
+            transport.read(timeout=0.1)
+
+    def test_read_raises_when_device_closes(self, tcp_transport):
+        transport, device = tcp_transport
+        device.sendall(b"\x02(1234567)")
+        device.close()
+        with pytest.raises(transports.TransportError):
+            transport.read()
+
+    @pytest.mark.parametrize("busy_wait", [False, True])
+    def test_recv_times_out_and_keeps_connection(self, tcp_transport, busy_wait):
+        transport, device = tcp_transport
+        transport.busy_wait = busy_wait
+        transport.timeout = 0.1
+        with pytest.raises(TimeoutError):
+            transport.recv(1)
+        assert transport.socket is not None
+        device.sendall(b"\x06")
+        assert transport.recv(1) == b"\x06"
+
+    def test_read_times_out(self, tcp_transport):
+        transport, device = tcp_transport
+        device.sendall(b"\x02(1234567)")
+        with pytest.raises(TimeoutError):
+            transport.read(timeout=0.2)
+
+
+class TestSerialTransportRead:
+    def test_read_drains_waiting_bytes(self):
+        frame = utils.add_bcc(b"\x02(1234567)\r\n!\r\n\x03")
+        transport = transports.SerialTransport(port="/dev/null", timeout=1)
+        transport.port = FakeSerialPort(frame)
+        assert transport.read() == frame
+        assert transport.port.reads == [1, len(frame) - 1]
+        # The serial port does not receive into a buffer.
+        assert transport._rxchunk is None
+
+
+class TestAsyncTcpTransport:
+    def run_with_device(self, device_data, client):
+        """
+        Runs client against a local server that sends device_data on connect.
+        Returns the client result and what the device received.
+        """
+        received = bytearray()
+
+        async def handle(reader, writer):
+            writer.write(device_data)
+            await writer.drain()
+            # Read until the client disconnects.
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                received.extend(data)
+            writer.close()
+            device_done.set()
+
+        async def main():
+            device_done.clear()
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            transport = transports.AsyncTcpTransport(("127.0.0.1", port), timeout=1)
+            await transport.connect()
+            try:
+                return await client(transport)
+            finally:
+                await transport.disconnect()
+                await device_done.wait()
+                server.close()
+                await server.wait_closed()
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        device_done = asyncio.Event()
+        try:
+            result = loop.run_until_complete(main())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        return result, bytes(received)
+
+    def test_read_partial_blocks(self):
+        first = utils.add_bcc(b"\x021.8.0(100*kWh)\x04")
+        last = utils.add_bcc(b"\x022.8.0(200*kWh)\r\n!\r\n\x03")
+        data, received = self.run_with_device(
+            first + last, lambda transport: transport.read()
+        )
+        assert data == utils.add_bcc(
+            b"\x021.8.0(100*kWh)\r\n2.8.0(200*kWh)\r\n!\r\n\x03"
+        )
+        assert received == b"\x06"
+
+    def test_socket_is_tuned(self):
+        async def socket_options(transport):
+            sock = transport.writer.get_extra_info("socket")
+            return (
+                sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY),
+                sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE),
+            )
+
+        (nodelay, keepalive), _ = self.run_with_device(b"", socket_options)
+        assert nodelay
+        assert keepalive
+
+    def test_simple_read(self):
+        data, _ = self.run_with_device(
+            b"/LGZ4ZMF100AC.M23\r\n",
+            lambda transport: transport.simple_read(start_char=b"/", end_char=b"\n"),
+        )
+        assert data == b"/LGZ4ZMF100AC.M23\r\n"
+
+
+class TestBaseTransportRead:
+    def test_read_long_frame_one_byte_per_fill(self):
+        data_sets = b"".join(
+            b"1.8.%d(%08d*kWh)\r\n" % (i % 10, i) for i in range(2000)
+        )
+        frame = utils.add_bcc(b"\x02" + data_sets + b"!\r\n\x03")
+        transport = OneByteTransport(frame)
+        assert transport.read() == frame
+
+    def test_read_discards_noise_before_frame(self):
+        frame = utils.add_bcc(b"\x02(1234567)\r\n!\r\n\x03")
+        transport = OneByteTransport(b"noise" + frame)
+        assert transport.read() == frame
+        assert not transport._rxbuf
+
+    def test_noise_is_removed_from_buffer(self):
+        transport = OneByteTransport(b"")
+        transport._rxbuf.extend(b"noise without start char")
+        with pytest.raises(TimeoutError):
+            transport.read(timeout=0.01)
+        assert not transport._rxbuf